@@ -0,0 +1,1663 @@
+import sys
+import csv
+import bisect
+import re
+from pathlib import Path
+
+from PyQt6.QtWidgets import (
+    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
+    QFormLayout, QGroupBox, QLineEdit, QComboBox, QPushButton,
+    QPlainTextEdit, QTreeWidget, QTreeWidgetItem, QTabWidget,
+    QMessageBox, QInputDialog, QLabel, QHeaderView, QSizePolicy,
+    QDialog, QProgressBar, QSplashScreen, QStackedWidget, QDoubleSpinBox, QDialogButtonBox
+)
+from PyQt6.QtCore import Qt, pyqtSignal, QObject, QTimer, QRunnable, QThreadPool, QLocale, QThread
+from PyQt6.QtGui import (
+    QFont, QGuiApplication, QColor, QPalette, QDoubleValidator, QIntValidator, QPixmap,
+    QTextCursor
+)
+
+from main import (
+    DEFAULT_CONFIG, Deduction, Employee, PayrollSystem, aggregate_payroll_results
+)
+
+
+CSV_WRITE_BUFFER = 1 << 20
+STATUS_MESSAGE_MS = 5000
+NUMBER_RE = re.compile(r'[+-]?(?:\d+\.?\d*|\.\d+)')
+INTEGER_RE = re.compile(r'[+-]?\d+')
+PAYROLL_CSV_HEADER = ("ID сотрудника", "Имя сотрудника", "Валовая заработная плата", "Чистая заработная плата",
+                      "Подоходный налог", "Соц. страхование (сотрудник)", "Другие вычеты",
+                      "Соц. страхование (работодатель)")
+
+APP_STYLESHEET = """
+    QMainWindow {
+        background-color: #2b2b2b;
+        color: #f0f0f0;
+    }
+    QGroupBox {
+        font-weight: bold;
+        border: 1px solid #555555;
+        border-radius: 8px;
+        margin-top: 10px;
+        padding-top: 15px;
+        background-color: #3c3c3c;
+        color: #f0f0f0;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        subcontrol-position: top center;
+        padding: 0 10px;
+        background-color: #4a4a4a;
+        border-radius: 5px;
+        color: #f0f0f0;
+    }
+    QPushButton {
+        background-color: #5cb85c;
+        color: white;
+        border-radius: 8px;
+        padding: 10px 15px;
+        font-weight: bold;
+        border: none;
+    }
+    QPushButton:hover {
+        background-color: #4cae4c;
+    }
+    QPushButton:pressed {
+        background-color: #449d44;
+    }
+    QLineEdit, QComboBox, QPlainTextEdit {
+        border: 1px solid #666666;
+        border-radius: 5px;
+        padding: 5px;
+        background-color: #4e4e4e;
+        color: #f0f0f0;
+    }
+    QComboBox::drop-down {
+        border-left: 1px solid #666666;
+    }
+    QComboBox::down-arrow {
+        image: url(data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAcAAAAECAYAAADg/bVnAAAAG0lEQVQIW2NkYGDwYDAwMGAiJgYGFIAaBgZgAAC0gAP2fW12LwAAAABJRU5ErkJggg==);
+    }
+    QTreeWidget {
+        border: 1px solid #666666;
+        border-radius: 5px;
+        background-color: #4e4e4e;
+        color: #f0f0f0;
+        alternate-background-color: #5a5a5a;
+    }
+    QTreeWidget::item:selected {
+        background-color: #007bff;
+        color: white;
+    }
+    QTabWidget::pane {
+        border: 1px solid #555555;
+        border-radius: 8px;
+        background-color: #3c3c3c;
+    }
+    QTabBar::tab {
+        background: #4a4a4a;
+        color: #f0f0f0;
+        border: 1px solid #555555;
+        border-bottom-left-radius: 4px;
+        border-bottom-right-radius: 4px;
+        padding: 8px 15px;
+    }
+    QTabBar::tab:selected {
+        background: #3c3c3c;
+        border-bottom-color: #3c3c3c;
+        font-weight: bold;
+    }
+    QLabel {
+        color: #f0f0f0;
+    }
+    QPushButton#dangerButton {
+        background-color: #f44336;
+    }
+    QPushButton#dangerButton:hover {
+        background-color: #da190b;
+    }
+    QPushButton#dangerButton:pressed {
+        background-color: #b00f04;
+    }
+"""
+
+
+class QtNotifier(QObject):
+    message = pyqtSignal(bool, str, str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.message.connect(self._show_message)
+
+    def __call__(self, ok, title, message):
+        self.message.emit(ok, title, message)
+
+    def _show_message(self, ok, title, message):
+        if ok:
+            show_success(self.parent(), title, message)
+        else:
+            QMessageBox.critical(self.parent(), title, message)
+
+
+class BackgroundTaskSignals(QObject):
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+
+class BackgroundTask(QRunnable):
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.signals = BackgroundTaskSignals()
+
+    def run(self):
+        try:
+            result = self.fn(*self.args)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
+
+
+def show_success(parent, title, message):
+    if isinstance(parent, QMainWindow):
+        parent.statusBar().showMessage(f"✓ {message}", STATUS_MESSAGE_MS)
+    else:
+        QMessageBox.information(parent, title, message)
+
+
+def show_status(parent, status, error_title, info_title="Информация"):
+    ok, message = status
+    if not message:
+        return ok
+    if ok:
+        show_success(parent, info_title, message)
+    else:
+        QMessageBox.critical(parent, error_title, message)
+    return ok
+
+
+def make_double_validator(parent, bottom=0.0, top=1e12, decimals=2):
+    validator = QDoubleValidator(bottom, top, decimals, parent)
+    validator.setNotation(QDoubleValidator.Notation.StandardNotation)
+    validator.setLocale(QLocale.c())
+    return validator
+
+
+def make_int_validator(parent, bottom=0, top=10_000):
+    validator = QIntValidator(bottom, top, parent)
+    validator.setLocale(QLocale.c())
+    return validator
+
+
+class TreeItemPool:
+    def __init__(self, tree):
+        self.tree = tree
+        self._spare = []
+
+    @staticmethod
+    def _fill(item, texts, data):
+        for column, text in enumerate(texts):
+            if item.text(column) != text:
+                item.setText(column, text)
+        if item.data(0, Qt.ItemDataRole.UserRole) != data:
+            item.setData(0, Qt.ItemDataRole.UserRole, data)
+        return item
+
+    def _acquire(self, texts, data):
+        return self._fill(self._spare.pop() if self._spare else QTreeWidgetItem(), texts, data)
+
+    def set_rows(self, rows):
+        tree = self.tree
+        sorting = tree.isSortingEnabled()
+        tree.setSortingEnabled(False)
+        tree.setUpdatesEnabled(False)
+        had_selection = bool(tree.selectedItems())
+        tree.blockSignals(True)
+        try:
+            tree.clearSelection()
+            tree.setCurrentItem(None)
+            count = tree.topLevelItemCount()
+            reused = 0
+            new_items = []
+            for texts, data in rows:
+                if reused < count:
+                    self._fill(tree.topLevelItem(reused), texts, data)
+                    reused += 1
+                else:
+                    new_items.append(self._acquire(texts, data))
+            for index in range(count - 1, reused - 1, -1):
+                self._spare.append(tree.takeTopLevelItem(index))
+            tree.addTopLevelItems(new_items)
+        finally:
+            tree.blockSignals(False)
+            tree.setUpdatesEnabled(True)
+            tree.setSortingEnabled(sorting)
+        if had_selection:
+            tree.itemSelectionChanged.emit()
+
+    def append_rows(self, rows):
+        tree = self.tree
+        sorting = tree.isSortingEnabled()
+        tree.setSortingEnabled(False)
+        tree.setUpdatesEnabled(False)
+        try:
+            tree.addTopLevelItems([self._acquire(texts, data) for texts, data in rows])
+        finally:
+            tree.setUpdatesEnabled(True)
+            tree.setSortingEnabled(sorting)
+
+
+class CustomDialog(QInputDialog):
+    def __init__(self, parent=None, title="", label="", initialValue="", okButtonText="ОК", cancelButtonText="Отмена"):
+        super().__init__(parent)
+        self.setWindowTitle(title)
+        self.setLabelText(label)
+        self.setTextValue(initialValue)
+        self.setOkButtonText(okButtonText)
+        self.setCancelButtonText(cancelButtonText)
+        self.setWindowFlags(self.windowFlags() & ~Qt.WindowType.WindowContextHelpButtonHint)
+
+    @staticmethod
+    def get_string(parent=None, title="", label="", initialValue="", okButtonText="ОК", cancelButtonText="Отмена"):
+        dialog = CustomDialog(parent, title, label, initialValue, okButtonText, cancelButtonText)
+        ok = dialog.exec()
+        if ok:
+            return dialog.textValue()
+        return None
+
+    @staticmethod
+    def get_float(parent=None, title="", label="", initialValue=0.0, okButtonText="ОК", cancelButtonText="Отмена"):
+        dialog = CustomDialog(parent, title, label, str(initialValue), okButtonText, cancelButtonText)
+        dialog.setInputMode(QInputDialog.InputMode.DoubleInput)
+        ok = dialog.exec()
+        if ok:
+            try:
+                return float(dialog.textValue())
+            except ValueError:
+                return None
+        return None
+
+    @staticmethod
+    def get_int(parent=None, title="", label="", initialValue=0, okButtonText="ОК", cancelButtonText="Отмена"):
+        dialog = CustomDialog(parent, title, label, str(initialValue), okButtonText, cancelButtonText)
+        dialog.setInputMode(QInputDialog.InputMode.IntInput)
+        ok = dialog.exec()
+        if ok:
+            try:
+                return int(dialog.textValue())
+            except ValueError:
+                return None
+        return None
+
+    @staticmethod
+    def get_choice(parent=None, title="", label="", items=[], initialItem="", editable=False, okButtonText="ОК",
+                   cancelButtonText="Отмена"):
+        dialog = QInputDialog(parent)
+        dialog.setWindowTitle(title)
+        dialog.setLabelText(label)
+        dialog.setComboBoxItems(items)
+        dialog.setOkButtonText(okButtonText)
+        dialog.setCancelButtonText(cancelButtonText)
+        dialog.setComboBoxEditable(editable)
+        dialog.setWindowFlags(dialog.windowFlags() & ~Qt.WindowType.WindowContextHelpButtonHint)
+
+        if initialItem in items:
+            dialog.setTextValue(initialItem)
+
+        ok = dialog.exec()
+        if ok:
+            return dialog.textValue()
+        return None
+
+
+class InputPrompter:
+    def __init__(self, parent):
+        self.parent = parent
+        self._dialog = None
+        self._form = None
+
+    def _prepare(self, title, label):
+        if self._dialog is None:
+            self._dialog = QInputDialog(self.parent)
+            self._dialog.setModal(True)
+            self._dialog.setWindowFlags(self._dialog.windowFlags() & ~Qt.WindowType.WindowContextHelpButtonHint)
+        dialog = self._dialog
+        dialog.setWindowTitle(title)
+        dialog.setLabelText(label)
+        return dialog
+
+    def get_text(self, title, label, text=""):
+        dialog = self._prepare(title, label)
+        dialog.setComboBoxItems([])
+        dialog.setInputMode(QInputDialog.InputMode.TextInput)
+        dialog.setTextValue(text)
+        ok = bool(dialog.exec())
+        return dialog.textValue(), ok
+
+    def get_item(self, title, label, items, current=0, editable=False):
+        dialog = self._prepare(title, label)
+        dialog.setInputMode(QInputDialog.InputMode.TextInput)
+        dialog.setComboBoxItems(items)
+        dialog.setComboBoxEditable(editable)
+        dialog.setTextValue(items[current])
+        ok = bool(dialog.exec())
+        return dialog.textValue(), ok
+
+    def get_double(self, title, label, value=0.0, minv=-2147483647.0, maxv=2147483647.0, decimals=1):
+        dialog = self._prepare(title, label)
+        dialog.setInputMode(QInputDialog.InputMode.DoubleInput)
+        dialog.setDoubleDecimals(decimals)
+        dialog.setDoubleRange(minv, maxv)
+        dialog.setDoubleValue(value)
+        ok = bool(dialog.exec())
+        return dialog.doubleValue(), ok
+
+    def _prepare_form(self):
+        if self._form is None:
+            form = self._form = QDialog(self.parent)
+            form.setModal(True)
+            form.setWindowFlags(form.windowFlags() & ~Qt.WindowType.WindowContextHelpButtonHint)
+            layout = QFormLayout(form)
+            self._form_name = QLineEdit()
+            layout.addRow("Название:", self._form_name)
+            self._form_type = QComboBox()
+            layout.addRow("Тип:", self._form_type)
+            self._form_value_label = QLabel()
+            self._form_value = QDoubleSpinBox()
+            self._form_value.setDecimals(4)
+            self._form_value.setRange(-2147483647.0, 2147483647.0)
+            layout.addRow(self._form_value_label, self._form_value)
+            buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+            buttons.button(QDialogButtonBox.StandardButton.Ok).setText("ОК")
+            buttons.button(QDialogButtonBox.StandardButton.Cancel).setText("Отмена")
+            buttons.accepted.connect(form.accept)
+            buttons.rejected.connect(form.reject)
+            layout.addRow(buttons)
+        return self._form
+
+    def get_named_value(self, title, types, value_label="Значение:"):
+        form = self._prepare_form()
+        form.setWindowTitle(title)
+        self._form_name.clear()
+        self._form_name.setFocus()
+        self._form_type.clear()
+        self._form_type.addItems(types)
+        self._form_value_label.setText(value_label)
+        self._form_value.setValue(0.0)
+        ok = bool(form.exec())
+        return self._form_name.text().strip(), self._form_type.currentText(), self._form_value.value(), ok
+
+
+class EmployeeDetailsWindow(QDialog):
+    employee_updated = pyqtSignal()
+
+    def __init__(self, employee: Employee, payroll_system: PayrollSystem, parent=None):
+        super().__init__(parent)
+        self.payroll_system = payroll_system
+        self._prompter = InputPrompter(self)
+        self.setModal(True)
+
+        self._init_ui()
+        self.load_employee(employee)
+
+    def load_employee(self, employee: Employee):
+        self.employee = employee
+        self._bonuses = [dict(bonus) for bonus in employee.bonuses]
+        self._deductions = [Deduction(ded.name, ded.type, ded.value) for ded in employee.custom_deductions]
+        self.setWindowTitle(f"Детали сотрудника: {employee.employee_id} ({employee.name})")
+        self.id_entry.setText(employee.employee_id)
+        self.name_entry.setText(employee.name)
+        self.base_salary_type_combo.setCurrentText(employee.base_salary_type)
+        self.base_salary_value_entry.setText(str(employee.base_salary_value))
+        self.hours_worked_entry.setText(str(employee.hours_worked if employee.hours_worked is not None else ""))
+        self.days_worked_entry.setText(str(employee.days_worked if employee.days_worked is not None else ""))
+        self.tax_exemptions_entry.setText(str(employee.tax_exemptions))
+        self._populate_bonuses_tree()
+        self._populate_deductions_tree()
+        self.name_entry.setFocus()
+
+    def _init_ui(self):
+        main_layout = QVBoxLayout()
+        self.setLayout(main_layout)
+
+        employee_data_group = QGroupBox("Редактирование данных сотрудника")
+        employee_data_layout = QFormLayout(employee_data_group)
+
+        self.id_entry = QLineEdit()
+        self.id_entry.setReadOnly(True)
+        employee_data_layout.addRow("ID сотрудника:", self.id_entry)
+
+        self.name_entry = QLineEdit()
+        employee_data_layout.addRow("Имя сотрудника:", self.name_entry)
+
+        self.base_salary_type_combo = QComboBox()
+        self.base_salary_type_combo.addItems(['monthly', 'hourly', 'daily'])
+        employee_data_layout.addRow("Тип ЗП:", self.base_salary_type_combo)
+
+        self.base_salary_value_entry = QLineEdit()
+        self.base_salary_value_entry.setValidator(make_double_validator(self))
+        employee_data_layout.addRow("Значение ЗП:", self.base_salary_value_entry)
+
+        self.hours_worked_entry = QLineEdit()
+        self.hours_worked_entry.setValidator(make_int_validator(self))
+        employee_data_layout.addRow("Отработано часов:", self.hours_worked_entry)
+
+        self.days_worked_entry = QLineEdit()
+        self.days_worked_entry.setValidator(make_int_validator(self))
+        employee_data_layout.addRow("Отработано дней:", self.days_worked_entry)
+
+        self.tax_exemptions_entry = QLineEdit()
+        self.tax_exemptions_entry.setValidator(make_double_validator(self))
+        employee_data_layout.addRow("Налоговые льготы:", self.tax_exemptions_entry)
+
+        main_layout.addWidget(employee_data_group)
+
+        bonuses_group = QGroupBox("Бонусы")
+        bonuses_layout = QVBoxLayout(bonuses_group)
+        self.bonuses_tree = QTreeWidget()
+        self.bonuses_tree.setHeaderLabels(["Название", "Тип", "Значение"])
+        self.bonuses_tree.setColumnCount(3)
+        self.bonuses_tree.header().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self._bonuses_pool = TreeItemPool(self.bonuses_tree)
+        bonuses_layout.addWidget(self.bonuses_tree)
+
+        bonus_buttons_layout = QHBoxLayout()
+        add_bonus_button = QPushButton("Добавить бонус")
+        add_bonus_button.clicked.connect(self._add_bonus)
+        remove_bonus_button = QPushButton("Удалить бонус")
+        remove_bonus_button.clicked.connect(self._remove_bonus)
+        bonus_buttons_layout.addWidget(add_bonus_button)
+        bonus_buttons_layout.addWidget(remove_bonus_button)
+        bonuses_layout.addLayout(bonus_buttons_layout)
+        main_layout.addWidget(bonuses_group)
+
+        deductions_group = QGroupBox("Пользовательские вычеты")
+        deductions_layout = QVBoxLayout(deductions_group)
+        self.deductions_tree = QTreeWidget()
+        self.deductions_tree.setHeaderLabels(["Название", "Тип", "Значение"])
+        self.deductions_tree.setColumnCount(3)
+        self.deductions_tree.header().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self._deductions_pool = TreeItemPool(self.deductions_tree)
+        deductions_layout.addWidget(self.deductions_tree)
+
+        deduction_buttons_layout = QHBoxLayout()
+        add_deduction_button = QPushButton("Добавить вычет")
+        add_deduction_button.clicked.connect(self._add_deduction)
+        remove_deduction_button = QPushButton("Удалить вычет")
+        remove_deduction_button.clicked.connect(self._remove_deduction)
+        deduction_buttons_layout.addWidget(add_deduction_button)
+        deduction_buttons_layout.addWidget(remove_deduction_button)
+        deductions_layout.addLayout(deduction_buttons_layout)
+        main_layout.addWidget(deductions_group)
+
+        save_cancel_layout = QHBoxLayout()
+        save_button = QPushButton("Сохранить")
+        save_button.clicked.connect(self._save_and_close)
+        cancel_button = QPushButton("Отмена")
+        cancel_button.clicked.connect(self.reject)
+        save_cancel_layout.addWidget(save_button)
+        save_cancel_layout.addWidget(cancel_button)
+        main_layout.addLayout(save_cancel_layout)
+
+    def _populate_bonuses_tree(self):
+        self._bonuses_pool.set_rows(
+            ((bonus.get('name', ''), bonus.get('type', ''), str(bonus.get('value', ''))), idx)
+            for idx, bonus in enumerate(self._bonuses))
+
+    def _add_bonus(self):
+        name, bonus_type, value, ok = self._prompter.get_named_value("Добавить бонус", ['amount', 'percentage'])
+        if ok and name:
+            if bonus_type == 'percentage' and not (0 <= value <= 1):
+                QMessageBox.critical(self, "Ошибка", "Процент бонуса должен быть между 0 и 1.")
+                return
+            self._bonuses.append({'name': name, 'type': bonus_type, 'value': value})
+            self._populate_bonuses_tree()
+        else:
+            QMessageBox.information(self, "Отмена", "Добавление бонуса отменено.")
+
+    def _remove_bonus(self):
+        selected_items = self.bonuses_tree.selectedItems()
+        if not selected_items:
+            QMessageBox.warning(self, "Предупреждение", "Выберите бонус для удаления.")
+            return
+
+        reply = QMessageBox.question(self, "Подтверждение удаления", "Вы уверены, что хотите удалить выбранные бонусы?",
+                                     QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+        if reply == QMessageBox.StandardButton.Yes:
+            selected = {item.data(0, Qt.ItemDataRole.UserRole) for item in selected_items}
+            self._bonuses = [bonus for idx, bonus in enumerate(self._bonuses) if idx not in selected]
+            self._populate_bonuses_tree()
+            QMessageBox.information(self, "Успех", "Выбранные бонусы удалены.")
+
+    def _populate_deductions_tree(self):
+        self._deductions_pool.set_rows(
+            ((ded.name, ded.type, str(ded.value)), idx)
+            for idx, ded in enumerate(self._deductions))
+
+    def _add_deduction(self):
+        name, deduction_type, value, ok = self._prompter.get_named_value("Добавить вычет", ['fixed', 'percentage'])
+        if ok and name:
+            if deduction_type == 'percentage' and not (0 <= value <= 1):
+                QMessageBox.critical(self, "Ошибка", "Процент вычета должен быть между 0 и 1.")
+                return
+            self._deductions.append(Deduction(name, deduction_type, value))
+            self._populate_deductions_tree()
+        else:
+            QMessageBox.information(self, "Отмена", "Добавление вычета отменено.")
+
+    def _remove_deduction(self):
+        selected_items = self.deductions_tree.selectedItems()
+        if not selected_items:
+            QMessageBox.warning(self, "Предупреждение", "Выберите вычет для удаления.")
+            return
+
+        reply = QMessageBox.question(self, "Подтверждение удаления", "Вы уверены, что хотите удалить выбранные вычеты?",
+                                     QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+        if reply == QMessageBox.StandardButton.Yes:
+            selected = {item.data(0, Qt.ItemDataRole.UserRole) for item in selected_items}
+            self._deductions = [ded for idx, ded in enumerate(self._deductions) if idx not in selected]
+            self._populate_deductions_tree()
+            QMessageBox.information(self, "Успех", "Выбранные вычеты удалены.")
+
+    def _save_and_close(self):
+        try:
+            name = self.name_entry.text().strip()
+            if not name:
+                raise ValueError("Имя сотрудника не может быть пустым.")
+
+            base_salary_type = self.base_salary_type_combo.currentText()
+            base_salary_value = float(self.base_salary_value_entry.text())
+
+            hours_worked_str = self.hours_worked_entry.text().strip()
+            hours_worked = int(hours_worked_str) if hours_worked_str else None
+
+            days_worked_str = self.days_worked_entry.text().strip()
+            days_worked = int(days_worked_str) if days_worked_str else None
+
+            tax_exemptions = float(self.tax_exemptions_entry.text())
+
+            self.employee.name = name
+            self.employee.base_salary_type = base_salary_type
+            self.employee.base_salary_value = base_salary_value
+            self.employee.hours_worked = hours_worked
+            self.employee.days_worked = days_worked
+            self.employee.tax_exemptions = tax_exemptions
+            self.employee.bonuses = list(self._bonuses)
+            self.employee.custom_deductions = list(self._deductions)
+
+            status = self.payroll_system.add_employee(self.employee)
+            self.employee_updated.emit()
+            if not show_status(self, status, "Ошибка сохранения"):
+                return
+            QMessageBox.information(self, "Успех",
+                                    f"Данные сотрудника {self.employee.employee_id} ({self.employee.name}) успешно обновлены.")
+            self.accept()
+
+        except ValueError as e:
+            QMessageBox.critical(self, "Ошибка сохранения", str(e))
+        except Exception as e:
+            QMessageBox.critical(self, "Неизвестная ошибка", f"Ошибка при сохранении: {e}")
+
+
+class ConfigEditorWindow(QDialog):
+    config_updated = pyqtSignal()
+
+    def __init__(self, payroll_system: PayrollSystem, parent=None):
+        super().__init__(parent)
+        self.payroll_system = payroll_system
+        self._prompter = InputPrompter(self)
+        self.setWindowTitle("Редактирование конфигурации")
+        self.setModal(True)
+
+        self._init_ui()
+
+    def _init_ui(self):
+        main_layout = QVBoxLayout()
+        self.setLayout(main_layout)
+
+        notebook = QTabWidget()
+        main_layout.addWidget(notebook)
+
+        tax_brackets_tab = QWidget()
+        notebook.addTab(tax_brackets_tab, "Налоговые скобки")
+        tax_layout = QVBoxLayout(tax_brackets_tab)
+
+        self.tax_tree = QTreeWidget()
+        self.tax_tree.setHeaderLabels(["Мин. доход", "Макс. доход", "Ставка (%)"])
+        self.tax_tree.setColumnCount(3)
+        self.tax_tree.header().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self._tax_pool = TreeItemPool(self.tax_tree)
+        tax_layout.addWidget(self.tax_tree)
+        self._populate_tax_tree()
+
+        tax_buttons_layout = QHBoxLayout()
+        add_tax_button = QPushButton("Добавить")
+        add_tax_button.clicked.connect(self._add_tax_bracket)
+        remove_tax_button = QPushButton("Удалить")
+        remove_tax_button.clicked.connect(self._remove_tax_bracket)
+        tax_buttons_layout.addWidget(add_tax_button)
+        tax_buttons_layout.addWidget(remove_tax_button)
+        tax_layout.addLayout(tax_buttons_layout)
+
+        social_security_tab = QWidget()
+        notebook.addTab(social_security_tab, "Социальное страхование")
+        ss_layout = QFormLayout(social_security_tab)
+
+        ss_config = self.payroll_system.config_loader.get_social_security_config()
+
+        self.employee_rate_entry = QLineEdit(str(ss_config.get('employee_rate', 0.0) * 100))
+        self.employee_rate_entry.setValidator(make_double_validator(self, top=100.0, decimals=4))
+        ss_layout.addRow("Ставка сотрудника (%):", self.employee_rate_entry)
+
+        self.max_employee_contrib_entry = QLineEdit(str(ss_config.get('max_employee_contribution', 0.0)))
+        self.max_employee_contrib_entry.setValidator(make_double_validator(self))
+        ss_layout.addRow("Макс. взнос сотрудника:", self.max_employee_contrib_entry)
+
+        self.employer_rate_entry = QLineEdit(str(ss_config.get('employer_rate', 0.0) * 100))
+        self.employer_rate_entry.setValidator(make_double_validator(self, top=100.0, decimals=4))
+        ss_layout.addRow("Ставка работодателя (%):", self.employer_rate_entry)
+
+        self.max_employer_contrib_entry = QLineEdit(str(ss_config.get('max_employer_contribution', 0.0)))
+        self.max_employer_contrib_entry.setValidator(make_double_validator(self))
+        ss_layout.addRow("Макс. взнос работодателя:", self.max_employer_contrib_entry)
+
+        default_deductions_tab = QWidget()
+        notebook.addTab(default_deductions_tab, "Вычеты по умолчанию")
+        ded_layout = QVBoxLayout(default_deductions_tab)
+
+        self.deductions_tree_config = QTreeWidget()
+        self.deductions_tree_config.setHeaderLabels(["Название", "Тип", "Значение"])
+        self.deductions_tree_config.setColumnCount(3)
+        self.deductions_tree_config.header().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self._deductions_pool = TreeItemPool(self.deductions_tree_config)
+        ded_layout.addWidget(self.deductions_tree_config)
+        self._populate_deductions_tree()
+
+        ded_buttons_layout = QHBoxLayout()
+        add_ded_button = QPushButton("Добавить")
+        add_ded_button.clicked.connect(self._add_default_deduction)
+        remove_ded_button = QPushButton("Удалить")
+        remove_ded_button.clicked.connect(self._remove_default_deduction)
+        ded_buttons_layout.addWidget(add_ded_button)
+        ded_buttons_layout.addWidget(remove_ded_button)
+        ded_layout.addLayout(ded_buttons_layout)
+
+        save_cancel_layout = QHBoxLayout()
+        save_button = QPushButton("Сохранить и Закрыть")
+        save_button.clicked.connect(self._save_config_and_close)
+        cancel_button = QPushButton("Отмена")
+        cancel_button.clicked.connect(self.reject)
+        save_cancel_layout.addWidget(save_button)
+        save_cancel_layout.addWidget(cancel_button)
+        main_layout.addLayout(save_cancel_layout)
+
+    def _populate_tax_tree(self):
+        rows = []
+        for idx, bracket in self.payroll_system.config_loader.get_sorted_tax_brackets():
+            max_income = bracket.get('max_income')
+            rows.append(((
+                f"{bracket.get('min_income'):.2f}",
+                str(max_income) if max_income is not None else "",
+                f"{bracket.get('rate') * 100:.2f}"
+            ), idx))
+        self._tax_pool.set_rows(rows)
+
+    def _add_tax_bracket(self):
+        min_income, ok_min = self._prompter.get_double("Добавить скобку", "Минимальный доход:")
+        if not ok_min: return
+
+        max_income_str, ok_max = self._prompter.get_text("Добавить скобку",
+                                                         "Максимальный доход (оставьте пустым для безлимита):")
+        max_income = float(max_income_str) if ok_max and max_income_str else None
+
+        rate, ok_rate = self._prompter.get_double("Добавить скобку", "Ставка (например, 0.10 для 10%):", decimals=3)
+        if not ok_rate: return
+
+        if not (0 <= rate <= 1):
+            QMessageBox.critical(self, "Ошибка", "Ставка должна быть от 0 до 1.")
+            return
+
+        new_bracket = {'min_income': min_income, 'rate': rate}
+        if max_income is not None:
+            new_bracket['max_income'] = max_income
+
+        bisect.insort(self.payroll_system.config_loader.config['tax_brackets'], new_bracket,
+                      key=lambda x: x.get('min_income', 0))
+        self.payroll_system.config_loader.invalidate()
+        self._populate_tax_tree()
+        self.payroll_system.logger.log_activity(
+            f"Добавлена налоговая скобка: Мин. {min_income}, Макс. {max_income}, Ставка {rate * 100:.2f}%.")
+
+    def _remove_tax_bracket(self):
+        selected_item = self.tax_tree.currentItem()
+        if not selected_item:
+            QMessageBox.warning(self, "Предупреждение", "Выберите налоговую скобку для удаления.")
+            return
+
+        bracket_index = selected_item.data(0, Qt.ItemDataRole.UserRole)
+        current_brackets = self.payroll_system.config_loader.config['tax_brackets']
+        removed = None
+        if isinstance(bracket_index, int) and 0 <= bracket_index < len(current_brackets):
+            removed = current_brackets.pop(bracket_index)
+
+        if removed is not None:
+            self.payroll_system.config_loader.invalidate()
+            self._populate_tax_tree()
+            QMessageBox.information(self, "Успех", "Налоговая скобка удалена.")
+            self.payroll_system.logger.log_activity(
+                f"Удалена налоговая скобка: Мин. {removed.get('min_income')}, Макс. {removed.get('max_income')}, "
+                f"Ставка {removed.get('rate') * 100:.2f}%.")
+        else:
+            QMessageBox.critical(self, "Ошибка", "Не удалось найти и удалить налоговую скобку.")
+
+    def _populate_deductions_tree(self):
+        rows = []
+        for ded_name, ded_info in self.payroll_system.config_loader.get_default_deductions().items():
+            ded_type = ded_info.get('type', '')
+            value_display = f"{ded_info.get('amount', 0):.2f}" if ded_type == 'fixed' \
+                else f"{ded_info.get('rate', 0) * 100:.2f}%"
+            rows.append(((ded_name, ded_type, value_display), None))
+        self._deductions_pool.set_rows(rows)
+
+    def _add_default_deduction(self):
+        name, deduction_type, value, ok = self._prompter.get_named_value(
+            "Добавить вычет по умолчанию", ['fixed', 'percentage'], "Значение (для % от 0 до 1):")
+        if not ok or not name: return
+
+        if deduction_type == 'percentage' and not (0 <= value <= 1):
+            QMessageBox.critical(self, "Ошибка", "Процент вычета должен быть между 0 и 1.")
+            return
+
+        if name in self.payroll_system.config_loader.config['deductions']:
+            QMessageBox.warning(self, "Предупреждение", f"Вычет '{name}' уже существует и будет обновлен.")
+
+        if deduction_type == 'fixed':
+            self.payroll_system.config_loader.config['deductions'][name] = {'type': deduction_type, 'amount': value}
+        else:
+            self.payroll_system.config_loader.config['deductions'][name] = {'type': deduction_type, 'rate': value}
+        self.payroll_system.config_loader.invalidate()
+        self._populate_deductions_tree()
+        self.payroll_system.logger.log_activity(f"Добавлен/обновлен вычет по умолчанию '{name}'.")
+
+    def _remove_default_deduction(self):
+        selected_item = self.deductions_tree_config.currentItem()
+        if not selected_item:
+            QMessageBox.warning(self, "Предупреждение", "Выберите вычет для удаления.")
+            return
+
+        name_to_remove = selected_item.text(0)
+        if name_to_remove in self.payroll_system.config_loader.config['deductions']:
+            del self.payroll_system.config_loader.config['deductions'][name_to_remove]
+            self.payroll_system.config_loader.invalidate()
+            self._populate_deductions_tree()
+            QMessageBox.information(self, "Успех", f"Вычет '{name_to_remove}' удален.")
+            self.payroll_system.logger.log_activity(f"Удален вычет по умолчанию '{name_to_remove}'.")
+        else:
+            QMessageBox.critical(self, "Ошибка", "Не удалось найти и удалить вычет.")
+
+    def _save_config_and_close(self):
+        try:
+            ss = self.payroll_system.config_loader.config['social_security']
+            employee_rate = float(self.employee_rate_entry.text()) / 100
+            max_employee_contribution = float(self.max_employee_contrib_entry.text())
+            employer_rate = float(self.employer_rate_entry.text()) / 100
+            max_employer_contribution = float(self.max_employer_contrib_entry.text())
+
+            if not (0 <= employee_rate <= 1 and 0 <= employer_rate <= 1):
+                raise ValueError("Ставки социального страхования должны быть от 0 до 1 (0% до 100%).")
+
+            ss['employee_rate'] = employee_rate
+            ss['max_employee_contribution'] = max_employee_contribution
+            ss['employer_rate'] = employer_rate
+            ss['max_employer_contribution'] = max_employer_contribution
+            self.payroll_system.config_loader.invalidate()
+
+            if not show_status(self, self.payroll_system.config_loader.save_config(), "Ошибка сохранения",
+                               info_title="Сохранение конфигурации"):
+                return
+            self.payroll_system.logger.log_activity("Конфигурация системы успешно обновлена.")
+            self.config_updated.emit()
+            self.accept()
+        except ValueError as e:
+            QMessageBox.critical(self, "Ошибка ввода", str(e))
+            self.payroll_system.logger.log_activity(f"Ошибка ввода при обновлении конфигурации: {e}")
+        except Exception as e:
+            QMessageBox.critical(self, "Ошибка сохранения", f"Произошла ошибка при сохранении конфигурации: {e}")
+            self.payroll_system.logger.log_activity(f"Неизвестная ошибка при сохранении конфигурации: {e}")
+
+
+class PayrollSystemLoader(QThread):
+    loaded = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, notifier, parent=None):
+        super().__init__(parent)
+        self.notifier = notifier
+
+    def run(self):
+        try:
+            config_file_path = Path("config.yaml")
+            created_message = None
+            if not config_file_path.exists():
+                with open(config_file_path, 'w', encoding='utf-8') as f:
+                    f.write(DEFAULT_CONFIG)
+                created_message = f"Создан файл конфигурации по умолчанию: {config_file_path}"
+            payroll_system = PayrollSystem(notifier=self.notifier)
+            if created_message:
+                payroll_system.logger.log_activity(created_message)
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.loaded.emit(payroll_system)
+
+
+class PayrollApp(QMainWindow):
+    EMPLOYEE_ROWS_BATCH = 200
+    FILTER_DEBOUNCE_MS = 150
+    ACTIVITY_LOG_MAX_LINES = 5000
+    TEXT_VIEW_MAX_BLOCKS = 20000
+    LOG_POLL_INTERVAL_MS = 1000
+    SALARY_TYPE_PAGES = {'monthly': 0, 'hourly': 1, 'daily': 2}
+    ready = pyqtSignal()
+    load_failed = pyqtSignal(str)
+    _styled = False
+
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("Система расчета заработной платы")
+        self.resize(1200, 800)
+        self._prompter = InputPrompter(self)
+
+        font = QFont("Arial", 10)
+        QApplication.setFont(font)
+
+        if not PayrollApp._styled:
+            QApplication.instance().setStyleSheet(APP_STYLESHEET)
+            PayrollApp._styled = True
+
+        self.payroll_system = None
+        self._details_window = None
+        self._log_timer = None
+        self._results_cache = None
+        self._results_totals = None
+        self._results_generation = 0
+        self._payroll_action_buttons = []
+        self._payroll_busy = False
+        self._create_widgets()
+        self.setEnabled(False)
+
+        self._loader = PayrollSystemLoader(QtNotifier(self), self)
+        self._loader.loaded.connect(self._on_payroll_system_loaded)
+        self._loader.failed.connect(self._on_payroll_system_load_failed)
+        self._loader.start()
+
+    def _on_payroll_system_loaded(self, payroll_system):
+        self.payroll_system = payroll_system
+        self._loader = None
+        show_status(self, self.payroll_system.config_loader.load_status, "Ошибка конфигурации")
+        show_status(self, self.payroll_system.load_status, "Ошибка загрузки")
+        self._populate_employee_list()
+        self._update_overall_statistics()
+        self.setEnabled(True)
+        self.ready.emit()
+
+    def _on_payroll_system_load_failed(self, message):
+        self._loader.wait()
+        self._loader = None
+        self.load_failed.emit(message)
+
+    def _create_widgets(self):
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        main_layout = QHBoxLayout(central_widget)
+        main_layout.setContentsMargins(15, 15, 15, 15)
+        main_layout.setSpacing(20)
+
+        left_frame = QWidget()
+        left_layout = QVBoxLayout(left_frame)
+        left_layout.setSpacing(10)
+        left_frame.setMinimumWidth(400)
+        left_frame.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+
+        employee_input_group = QGroupBox("Данные сотрудника")
+        employee_input_layout = QFormLayout(employee_input_group)
+        employee_input_layout.setContentsMargins(10, 20, 10, 10)
+        employee_input_layout.setSpacing(8)
+
+        self.employee_id_entry = QLineEdit("EMP001")
+        self.employee_id_entry.setReadOnly(True)
+        employee_input_layout.addRow("ID сотрудника:", self.employee_id_entry)
+
+        self.employee_name_entry = QLineEdit("Иван Иванов")
+        employee_input_layout.addRow("Имя сотрудника:", self.employee_name_entry)
+
+        self.base_salary_type_combo = QComboBox()
+        self.base_salary_type_combo.addItems(['monthly', 'hourly', 'daily'])
+        self.base_salary_type_combo.setCurrentText("monthly")
+        self.base_salary_type_combo.currentTextChanged.connect(self._update_salary_type_fields)
+        employee_input_layout.addRow("Тип базовой зарплаты:", self.base_salary_type_combo)
+
+        self.base_salary_value_entry = QLineEdit("4500.0")
+        self.base_salary_value_entry.setValidator(make_double_validator(self))
+        employee_input_layout.addRow("Значение базовой зарплаты:", self.base_salary_value_entry)
+
+        self.hours_worked_label = QLabel("Отработано часов:")
+        self.hours_worked_entry = QLineEdit("160")
+        self.hours_worked_entry.setValidator(make_int_validator(self))
+        hours_worked_page = QWidget()
+        self.hours_worked_layout = QHBoxLayout(hours_worked_page)
+        self.hours_worked_layout.setContentsMargins(0, 0, 0, 0)
+        self.hours_worked_layout.addWidget(self.hours_worked_label)
+        self.hours_worked_layout.addWidget(self.hours_worked_entry)
+
+        self.days_worked_label = QLabel("Отработано дней:")
+        self.days_worked_entry = QLineEdit("20")
+        self.days_worked_entry.setValidator(make_int_validator(self))
+        days_worked_page = QWidget()
+        self.days_worked_layout = QHBoxLayout(days_worked_page)
+        self.days_worked_layout.setContentsMargins(0, 0, 0, 0)
+        self.days_worked_layout.addWidget(self.days_worked_label)
+        self.days_worked_layout.addWidget(self.days_worked_entry)
+
+        self._salary_stack = QStackedWidget()
+        self._salary_stack.addWidget(QWidget())
+        self._salary_stack.addWidget(hours_worked_page)
+        self._salary_stack.addWidget(days_worked_page)
+        employee_input_layout.addRow(self._salary_stack)
+
+        self.tax_exemptions_entry = QLineEdit("100.0")
+        self.tax_exemptions_entry.setValidator(make_double_validator(self))
+        employee_input_layout.addRow("Налоговые льготы:", self.tax_exemptions_entry)
+
+        left_layout.addWidget(employee_input_group)
+        self._update_salary_type_fields()
+
+        employee_buttons_layout = QHBoxLayout()
+        add_update_button = QPushButton("Добавить/Обновить сотрудника")
+        add_update_button.clicked.connect(self._add_employee_gui)
+        delete_button = QPushButton("Удалить сотрудника")
+        delete_button.clicked.connect(self._delete_employee_gui)
+        edit_selected_button = QPushButton("Редактировать выбранного")
+        edit_selected_button.clicked.connect(self._edit_selected_employee)
+        self._payroll_action_buttons += [add_update_button, delete_button, edit_selected_button]
+        employee_buttons_layout.addWidget(add_update_button)
+        employee_buttons_layout.addWidget(delete_button)
+        employee_buttons_layout.addWidget(edit_selected_button)
+        left_layout.addLayout(employee_buttons_layout)
+
+        search_filter_group = QGroupBox("Поиск и Фильтр")
+        search_filter_layout = QFormLayout(search_filter_group)
+        search_filter_layout.setContentsMargins(10, 20, 10, 10)
+        search_filter_layout.setSpacing(8)
+
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(self.FILTER_DEBOUNCE_MS)
+        self._filter_timer.timeout.connect(self._filter_employees_gui)
+
+        self.search_entry = QLineEdit()
+        self.search_entry.setPlaceholderText("Поиск по ID или имени...")
+        self.search_entry.textChanged.connect(lambda _: self._filter_timer.start())
+        search_filter_layout.addRow("Поиск (ID/Имя):", self.search_entry)
+
+        self.filter_salary_type_combo = QComboBox()
+        self.filter_salary_type_combo.addItems(['Все', 'monthly', 'hourly', 'daily'])
+        self.filter_salary_type_combo.currentTextChanged.connect(lambda _: self._filter_timer.start())
+        search_filter_layout.addRow("Фильтр по типу ЗП:", self.filter_salary_type_combo)
+
+        left_layout.addWidget(search_filter_group)
+
+        employee_list_group = QGroupBox("Список сотрудников")
+        employee_list_layout = QVBoxLayout(employee_list_group)
+        employee_list_layout.setContentsMargins(10, 20, 10, 10)
+
+        self.employee_tree = QTreeWidget()
+        self.employee_tree.setHeaderLabels(["ID", "Имя", "Тип ЗП", "Значение ЗП"])
+        self.employee_tree.setColumnCount(4)
+        self.employee_tree.header().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self._employee_pool = TreeItemPool(self.employee_tree)
+        self.employee_tree.itemSelectionChanged.connect(self._on_employee_select)
+        self.employee_tree.verticalScrollBar().valueChanged.connect(self._load_more_employee_rows)
+        self._employee_rows = []
+        self._employee_rows_loaded = 0
+        self._employee_rows_stale = True
+        employee_list_layout.addWidget(self.employee_tree)
+        left_layout.addWidget(employee_list_group)
+
+        statistics_group = QGroupBox("Общая статистика")
+        statistics_layout = QFormLayout(statistics_group)
+        statistics_layout.setContentsMargins(10, 20, 10, 10)
+        statistics_layout.setSpacing(8)
+
+        self.total_employees_label = QLabel("Всего сотрудников: 0")
+        self.total_gross_pay_label = QLabel("Общая валовая ЗП: 0.00")
+        self.total_net_pay_label = QLabel("Общая чистая ЗП: 0.00")
+        self.total_tax_deductions_label = QLabel("Общие вычеты (налоги и т.д.): 0.00")
+
+        statistics_layout.addRow(self.total_employees_label)
+        statistics_layout.addRow(self.total_gross_pay_label)
+        statistics_layout.addRow(self.total_net_pay_label)
+        statistics_layout.addRow(self.total_tax_deductions_label)
+
+        left_layout.addWidget(statistics_group)
+
+        clear_all_button = QPushButton("Очистить все данные")
+        clear_all_button.setObjectName("dangerButton")
+        clear_all_button.clicked.connect(self._clear_all_data_gui)
+        self._payroll_action_buttons.append(clear_all_button)
+        left_layout.addWidget(clear_all_button)
+
+        main_layout.addWidget(left_frame)
+
+        right_frame = QWidget()
+        right_layout = QVBoxLayout(right_frame)
+        right_layout.setContentsMargins(0, 0, 0, 0)
+        right_frame.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+
+        self.main_notebook = QTabWidget()
+        right_layout.addWidget(self.main_notebook)
+
+        payroll_tab = QWidget()
+        self.main_notebook.addTab(payroll_tab, "Расчеты")
+        self._create_payroll_tab_content(payroll_tab)
+
+        reports_tab = QWidget()
+        self.main_notebook.addTab(reports_tab, "Отчеты")
+
+        activity_log_tab = QWidget()
+        self.main_notebook.addTab(activity_log_tab, "Журнал Активности")
+        self._activity_log_tab = activity_log_tab
+
+        self._pending_tabs = {
+            reports_tab: self._create_reports_tab_content,
+            activity_log_tab: self._create_activity_log_tab_content,
+        }
+        self.main_notebook.currentChanged.connect(self._on_tab_changed)
+
+        main_layout.addWidget(right_frame)
+
+    def _on_tab_changed(self, index):
+        tab = self.main_notebook.widget(index)
+        create_content = self._pending_tabs.pop(tab, None)
+        if create_content is not None:
+            create_content(tab)
+        if self._log_timer is not None:
+            if tab is self._activity_log_tab:
+                self._log_timer.start()
+            else:
+                self._log_timer.stop()
+
+    def _create_payroll_tab_content(self, parent_widget):
+        layout = QVBoxLayout(parent_widget)
+        layout.setContentsMargins(10, 10, 10, 10)
+        layout.setSpacing(10)
+
+        calc_buttons_layout = QHBoxLayout()
+        self.calculate_all_button = QPushButton("Рассчитать зарплату (все)")
+        self.calculate_all_button.clicked.connect(self._calculate_all_payroll_gui)
+        export_csv_button = QPushButton("Экспорт результатов в CSV")
+        export_csv_button.clicked.connect(self._export_payroll_results_csv)
+        self._payroll_action_buttons += [self.calculate_all_button, export_csv_button]
+        edit_config_button = QPushButton("Редактировать конфигурацию")
+        edit_config_button.clicked.connect(self._open_config_editor_window)
+        self._payroll_action_buttons.append(edit_config_button)
+        calc_buttons_layout.addWidget(self.calculate_all_button)
+        calc_buttons_layout.addWidget(export_csv_button)
+        calc_buttons_layout.addWidget(edit_config_button)
+        layout.addLayout(calc_buttons_layout)
+
+        self.payroll_progress_bar = QProgressBar()
+        self.payroll_progress_bar.setRange(0, 0)
+        self.payroll_progress_bar.hide()
+        layout.addWidget(self.payroll_progress_bar)
+
+        result_group = QGroupBox("Результаты расчета")
+        result_layout = QVBoxLayout(result_group)
+        result_layout.setContentsMargins(10, 20, 10, 10)
+        self.payroll_summary_text = QPlainTextEdit()
+        self.payroll_summary_text.setReadOnly(True)
+        self.payroll_summary_text.document().setMaximumBlockCount(self.TEXT_VIEW_MAX_BLOCKS)
+        result_layout.addWidget(self.payroll_summary_text)
+        layout.addWidget(result_group)
+
+    def _create_reports_tab_content(self, parent_widget):
+        layout = QVBoxLayout(parent_widget)
+        layout.setContentsMargins(10, 10, 10, 10)
+        layout.setSpacing(10)
+
+        reports_text_group = QGroupBox("Сводные Отчеты")
+        reports_text_layout = QVBoxLayout(reports_text_group)
+        reports_text_layout.setContentsMargins(10, 20, 10, 10)
+        self.reports_text = QPlainTextEdit()
+        self.reports_text.setReadOnly(True)
+        self.reports_text.document().setMaximumBlockCount(self.TEXT_VIEW_MAX_BLOCKS)
+        reports_text_layout.addWidget(self.reports_text)
+        layout.addWidget(reports_text_group)
+
+        reports_buttons_layout = QHBoxLayout()
+        generate_report_button = QPushButton("Сгенерировать сводный отчет")
+        generate_report_button.clicked.connect(self._generate_summary_report)
+        export_report_button = QPushButton("Экспорт отчета в CSV")
+        export_report_button.clicked.connect(self._export_summary_report_csv)
+        self._payroll_action_buttons += [generate_report_button, export_report_button]
+        generate_report_button.setEnabled(not self._payroll_busy)
+        export_report_button.setEnabled(not self._payroll_busy)
+        reports_buttons_layout.addWidget(generate_report_button)
+        reports_buttons_layout.addWidget(export_report_button)
+        layout.addLayout(reports_buttons_layout)
+
+    def _create_activity_log_tab_content(self, parent_widget):
+        layout = QVBoxLayout(parent_widget)
+        layout.setContentsMargins(10, 10, 10, 10)
+        layout.setSpacing(10)
+
+        log_group = QGroupBox("Системный Журнал Активности")
+        log_layout = QVBoxLayout(log_group)
+        log_layout.setContentsMargins(10, 20, 10, 10)
+        self.activity_log_text = QPlainTextEdit()
+        self.activity_log_text.setReadOnly(True)
+        self.activity_log_text.document().setMaximumBlockCount(self.TEXT_VIEW_MAX_BLOCKS)
+        log_layout.addWidget(self.activity_log_text)
+        layout.addWidget(log_group)
+
+        refresh_log_button = QPushButton("Обновить Журнал")
+        refresh_log_button.clicked.connect(self._refresh_activity_log)
+        self._log_offset = 0
+        layout.addWidget(refresh_log_button, alignment=Qt.AlignmentFlag.AlignCenter)
+
+        self._log_timer = QTimer(self)
+        self._log_timer.setInterval(self.LOG_POLL_INTERVAL_MS)
+        self._log_timer.timeout.connect(self._poll_activity_log)
+
+        self._refresh_activity_log()
+
+    def _poll_activity_log(self):
+        if self.payroll_system.logger.size() != self._log_offset:
+            self._refresh_activity_log()
+
+    def _refresh_activity_log(self):
+        if not hasattr(self, 'activity_log_text'):
+            return
+        start, self._log_offset, text = self.payroll_system.logger.read_log(
+            self._log_offset, self.ACTIVITY_LOG_MAX_LINES)
+        log_view = self.activity_log_text
+        log_view.setUpdatesEnabled(False)
+        if start == 0:
+            log_view.setPlainText(text)
+        elif text:
+            log_view.moveCursor(QTextCursor.MoveOperation.End)
+            log_view.insertPlainText(text)
+        log_view.setUpdatesEnabled(True)
+        log_view.moveCursor(QTextCursor.MoveOperation.End)
+
+    def _invalidate_results(self):
+        self._results_cache = None
+        self._results_totals = None
+        self._results_generation += 1
+
+    def _forget_result(self, employee_id):
+        cached_results = self._results_cache
+        self._invalidate_results()
+        if cached_results is not None:
+            self._results_cache = {emp_id: result for emp_id, result in cached_results.items()
+                                   if emp_id != employee_id}
+
+    def _results_or_compute(self, cached_results):
+        if cached_results is not None:
+            return cached_results
+        return self.payroll_system.process_all_payroll()
+
+    def _totals_or_aggregate(self, all_results, cached_results, cached_totals):
+        if cached_totals is not None and all_results is cached_results:
+            return cached_totals
+        return aggregate_payroll_results(all_results)
+
+    def _set_payroll_actions_busy(self, busy):
+        self._payroll_busy = busy
+        for button in self._payroll_action_buttons:
+            button.setEnabled(not busy)
+        self.payroll_progress_bar.setVisible(busy)
+
+    def _start_background_task(self, fn, on_finished, error_title, error_text, *args):
+        self._task_generation = self._results_generation
+        self._task_on_finished = on_finished
+        self._task_error = (error_title, error_text)
+        self._set_payroll_actions_busy(True)
+
+        task = BackgroundTask(fn, *args)
+        task.signals.finished.connect(self._on_background_task_finished)
+        task.signals.failed.connect(self._on_background_task_failed)
+        QThreadPool.globalInstance().start(task)
+
+    def _on_background_task_finished(self, outcome):
+        self._set_payroll_actions_busy(False)
+        all_results, totals, payload = outcome
+        if self._task_generation == self._results_generation:
+            if all_results is not self._results_cache:
+                self._results_totals = None
+            self._results_cache = all_results
+            if totals is not None:
+                self._results_totals = totals
+        self._task_on_finished(all_results, payload)
+
+    def _on_background_task_failed(self, message):
+        self._set_payroll_actions_busy(False)
+        error_title, error_text = self._task_error
+        QMessageBox.critical(self, error_title, f"{error_text}: {message}")
+
+    def _generate_summary_report(self):
+        self.reports_text.clear()
+        self._start_background_task(self._build_summary_report, self._on_summary_report_built,
+                                    "Ошибка отчета", "Ошибка при генерации сводного отчета",
+                                    self._results_cache, self._results_totals, len(self.payroll_system.employees))
+
+    def _build_summary_report(self, cached_results, cached_totals, employee_count):
+        all_results = self._results_or_compute(cached_results)
+        if not all_results:
+            return all_results, None, None
+
+        totals = self._totals_or_aggregate(all_results, cached_results, cached_totals)
+
+        parts = [
+            "--- Сводный Отчет по Заработной Плате ---\n\n",
+            f"Общее количество сотрудников: {employee_count}\n",
+            f"Общая валовая заработная плата: {totals.gross_pay:.2f}\n",
+            f"Общая чистая заработная плата: {totals.net_pay:.2f}\n",
+            f"Общие вычеты сотрудников (налоги, пенсионные и т.д.): {totals.employee_taxes + totals.employee_deductions:.2f}\n",
+            f"Общие взносы работодателя: {totals.employer_contributions:.2f}\n\n",
+            "--- Детали по вычетам сотрудников ---\n",
+        ]
+        parts.extend(f"  - {name}: {amount:.2f}\n" for name, amount in totals.by_type.items())
+        return all_results, totals, "".join(parts)
+
+    def _on_summary_report_built(self, all_results, report_summary):
+        if report_summary is None:
+            self.reports_text.setPlainText("Нет данных для генерации отчета.")
+            return
+
+        self.reports_text.setPlainText(report_summary)
+        show_success(self, "Отчет", "Сводный отчет сгенерирован.")
+        self.payroll_system.logger.log_activity("Сводный отчет по заработной плате сгенерирован.")
+
+    def _prompt_csv_path(self, title, label):
+        file_path, ok = self._prompter.get_text(title, label)
+        if not ok or not file_path:
+            return None
+        if not file_path.endswith(".csv"):
+            file_path += ".csv"
+        return file_path
+
+    def _export_summary_report_csv(self):
+        if self._results_cache is not None and not self._results_cache:
+            QMessageBox.warning(self, "Предупреждение", "Нет данных для экспорта сводного отчета.")
+            return
+
+        file_path = self._prompt_csv_path("Экспорт сводного отчета в CSV",
+                                          "Введите имя файла (например, summary_report.csv):")
+        if file_path is None:
+            return
+        self._start_background_task(self._write_summary_report_csv, self._on_summary_report_exported,
+                                    "Ошибка экспорта", "Произошла ошибка при экспорте",
+                                    file_path, self._results_cache, self._results_totals,
+                                    len(self.payroll_system.employees))
+
+    def _write_summary_report_csv(self, file_path, cached_results, cached_totals, employee_count):
+        all_results = self._results_or_compute(cached_results)
+        if not all_results:
+            return all_results, None, None
+
+        totals = self._totals_or_aggregate(all_results, cached_results, cached_totals)
+        aggregated_taxes = totals.by_type
+        tax_ded_columns = sorted(aggregated_taxes)
+        pad = [''] * len(tax_ded_columns)
+
+        rows = [
+            ["Метрика", "Значение", *tax_ded_columns],
+            ["Общее количество сотрудников", employee_count, *pad],
+            ["Общая валовая заработная плата", f"{totals.gross_pay:.2f}", *pad],
+            ["Общая чистая заработная плата", f"{totals.net_pay:.2f}", *pad],
+            ["Общие вычеты сотрудников (налоги, пенсионные и т.д.)",
+             f"{totals.employee_taxes + totals.employee_deductions:.2f}", *pad],
+            ["Общие взносы работодателя", f"{totals.employer_contributions:.2f}", *pad],
+            ["Детали по вычетам сотрудников", "", *pad],
+        ]
+        rows.extend([f"  {col}", f"{aggregated_taxes[col]:.2f}", *pad] for col in tax_ded_columns)
+
+        try:
+            with open(file_path, 'w', encoding='utf-8', newline='', buffering=CSV_WRITE_BUFFER) as f:
+                csv.writer(f, lineterminator='\n').writerows(rows)
+        except Exception as e:
+            self.payroll_system.logger.log_activity(f"Ошибка экспорта сводного отчета в CSV: {e}")
+            raise
+        return all_results, totals, file_path
+
+    def _on_summary_report_exported(self, all_results, file_path):
+        if file_path is None:
+            QMessageBox.warning(self, "Предупреждение", "Нет данных для экспорта сводного отчета.")
+            return
+        show_success(self, "Экспорт завершен", f"Сводный отчет успешно экспортирован в '{file_path}'.")
+        self.payroll_system.logger.log_activity(f"Сводный отчет экспортирован в CSV: '{file_path}'.")
+
+    def _update_salary_type_fields(self):
+        self._salary_stack.setCurrentIndex(
+            self.SALARY_TYPE_PAGES.get(self.base_salary_type_combo.currentText(), 0))
+
+    def _get_input_value(self, entry_widget, type_converter, field_name, allow_empty=False):
+        value_str = entry_widget.text().strip()
+        if not value_str:
+            if allow_empty:
+                return None
+            else:
+                raise ValueError(f"Поле '{field_name}' не может быть пустым.")
+        pattern = INTEGER_RE if type_converter is int else NUMBER_RE
+        if pattern.fullmatch(value_str) is None:
+            raise ValueError(f"Некорректное значение для '{field_name}'. Пожалуйста, введите число.")
+        return type_converter(value_str)
+
+    def _add_employee_gui(self):
+        try:
+            employee_id = self.employee_id_entry.text().strip()
+            if not employee_id:
+                QMessageBox.critical(self, "Ошибка ввода", "ID сотрудника не может быть пустым.")
+                return
+
+            employee_name = self.employee_name_entry.text().strip()
+            if not employee_name:
+                QMessageBox.critical(self, "Ошибка ввода", "Имя сотрудника не может быть пустым.")
+                return
+
+            base_salary_type = self.base_salary_type_combo.currentText()
+            base_salary_value = self._get_input_value(self.base_salary_value_entry, float, "Базовая зарплата")
+
+            hours_worked = None
+            if base_salary_type == 'hourly':
+                hours_worked = self._get_input_value(self.hours_worked_entry, int, "Отработано часов")
+
+            days_worked = None
+            if base_salary_type == 'daily':
+                days_worked = self._get_input_value(self.days_worked_entry, int, "Отработано дней")
+
+            tax_exemptions = self._get_input_value(self.tax_exemptions_entry, float, "Налоговые льготы",
+                                                   allow_empty=True) or 0.0
+
+            employee = self.payroll_system.get_employee(employee_id)
+            if employee:
+                employee.name = employee_name
+                employee.base_salary_type = base_salary_type
+                employee.base_salary_value = base_salary_value
+                employee.hours_worked = hours_worked
+                employee.days_worked = days_worked
+                employee.tax_exemptions = tax_exemptions
+            else:
+                employee = Employee(employee_id, employee_name, base_salary_type, base_salary_value,
+                                    hours_worked=hours_worked, days_worked=days_worked,
+                                    tax_exemptions=tax_exemptions)
+            status = self.payroll_system.add_employee(employee)
+            self._invalidate_results()
+            if show_status(self, status, "Ошибка сохранения"):
+                show_success(self, "Успех", f"Сотрудник {employee_id} ({employee_name}) успешно добавлен/обновлен.")
+            self._populate_employee_list()
+            self._clear_input_fields()
+            self._update_overall_statistics()
+
+        except ValueError as e:
+            QMessageBox.critical(self, "Ошибка ввода", str(e))
+        except Exception as e:
+            QMessageBox.critical(self, "Неизвестная ошибка", f"Произошла ошибка: {e}")
+
+    def _delete_employee_gui(self):
+        selected_items = self.employee_tree.selectedItems()
+        if not selected_items:
+            QMessageBox.warning(self, "Предупреждение", "Пожалуйста, выберите сотрудника для удаления.")
+            return
+
+        employee_id = selected_items[0].text(0)
+        reply = QMessageBox.question(self, "Подтверждение удаления",
+                                     f"Вы уверены, что хотите удалить сотрудника с ID: {employee_id}?",
+                                     QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+        if reply == QMessageBox.StandardButton.Yes:
+            self.payroll_system.delete_employee(employee_id)
+            if self.payroll_system.get_employee(employee_id) is None:
+                self._forget_result(employee_id)
+                self._populate_employee_list()
+                self._clear_input_fields()
+                self._update_overall_statistics()
+
+    def _edit_selected_employee(self):
+        selected_items = self.employee_tree.selectedItems()
+        if not selected_items:
+            QMessageBox.warning(self, "Предупреждение", "Пожалуйста, выберите сотрудника для редактирования.")
+            return
+
+        employee_id = selected_items[0].text(0)
+        employee = self.payroll_system.get_employee(employee_id)
+
+        if employee:
+            if self._details_window is None:
+                self._details_window = EmployeeDetailsWindow(employee, self.payroll_system, self)
+                self._details_window.employee_updated.connect(self._invalidate_results)
+                self._details_window.employee_updated.connect(self._populate_employee_list)
+                self._details_window.employee_updated.connect(self._update_overall_statistics)
+            else:
+                self._details_window.load_employee(employee)
+            self._details_window.exec()
+        else:
+            QMessageBox.critical(self, "Ошибка", "Выбранный сотрудник не найден.")
+
+    def _open_config_editor_window(self):
+        config_window = ConfigEditorWindow(self.payroll_system, self)
+        config_window.config_updated.connect(self._reinitialize_calculator)
+        config_window.exec()
+
+    def _reinitialize_calculator(self):
+        self.payroll_system.rebuild_calculator()
+        self._invalidate_results()
+        self.payroll_system.logger.log_activity(
+            "Калькулятор заработной платы переинициализирован с новой конфигурацией.")
+        self._update_overall_statistics()
+
+    def _on_employee_select(self):
+        selected_items = self.employee_tree.selectedItems()
+        if selected_items:
+            employee_id = selected_items[0].text(0)
+            employee = self.payroll_system.get_employee(employee_id)
+            if employee:
+                self.employee_id_entry.setReadOnly(False)
+                self.employee_id_entry.setText(employee.employee_id)
+                self.employee_id_entry.setReadOnly(True)
+
+                self.employee_name_entry.setText(employee.name)
+                self.base_salary_type_combo.setCurrentText(employee.base_salary_type)
+                self.base_salary_value_entry.setText(str(employee.base_salary_value))
+                self.tax_exemptions_entry.setText(str(employee.tax_exemptions))
+
+                if employee.base_salary_type == 'hourly':
+                    self.hours_worked_entry.setText(
+                        str(employee.hours_worked if employee.hours_worked is not None else ""))
+                elif employee.base_salary_type == 'daily':
+                    self.days_worked_entry.setText(
+                        str(employee.days_worked if employee.days_worked is not None else ""))
+                self._update_salary_type_fields()
+        else:
+            self._clear_input_fields()
+
+    def _filter_employees_gui(self):
+        search_query = self.search_entry.text().strip().lower()
+        filter_type = self.filter_salary_type_combo.currentText()
+
+        rows = []
+        for emp in self.payroll_system.employees.values():
+            if filter_type != "Все" and emp.base_salary_type != filter_type:
+                continue
+            if search_query:
+                id_lower, name_lower = emp.search_keys()
+                if search_query not in id_lower and search_query not in name_lower:
+                    continue
+            rows.append(emp)
+
+        if rows == self._employee_rows and not self._employee_rows_stale:
+            return
+        self._employee_rows_stale = False
+        self._employee_rows = rows
+        self._employee_rows_loaded = min(len(rows), self.EMPLOYEE_ROWS_BATCH)
+        self._employee_pool.set_rows(
+            self._employee_row(emp) for emp in rows[:self._employee_rows_loaded])
+
+    def _employee_row(self, emp):
+        return (emp.employee_id, emp.name, emp.base_salary_type, f"{emp.base_salary_value:.2f}"), None
+
+    def _load_more_employee_rows(self, value):
+        if self._employee_rows_loaded >= len(self._employee_rows):
+            return
+        if value < self.employee_tree.verticalScrollBar().maximum():
+            return
+        start = self._employee_rows_loaded
+        self._employee_rows_loaded = min(len(self._employee_rows), start + self.EMPLOYEE_ROWS_BATCH)
+        self._employee_pool.append_rows(
+            self._employee_row(emp) for emp in self._employee_rows[start:self._employee_rows_loaded])
+
+    def _populate_employee_list(self):
+        self._employee_rows_stale = True
+        self._filter_employees_gui()
+        self._update_overall_statistics()
+
+    def _clear_input_fields(self):
+        self.employee_id_entry.setReadOnly(False)
+        self.employee_id_entry.setText("EMP001")
+        self.employee_id_entry.setReadOnly(True)
+
+        self.employee_name_entry.setText("Иван Иванов")
+        self.base_salary_type_combo.setCurrentText("monthly")
+        self.base_salary_value_entry.setText("4500.0")
+
+        self.hours_worked_entry.setText("160")
+        self.days_worked_entry.setText("20")
+        self._update_salary_type_fields()
+
+        self.tax_exemptions_entry.setText("100.0")
+
+    def _calculate_all_payroll_gui(self):
+        self.payroll_summary_text.clear()
+        self._start_background_task(self._calculate_all_payroll, self._on_payroll_calculated,
+                                    "Ошибка расчета", "Ошибка при расчете заработной платы")
+
+    def _calculate_all_payroll(self):
+        return self.payroll_system.process_all_payroll(), None, None
+
+    def _on_payroll_calculated(self, all_results, _):
+        if not all_results:
+            self.payroll_summary_text.setPlainText("Нет результатов для отображения.")
+            return
+
+        parts = []
+        append = parts.append
+        employees = self.payroll_system.employees
+        for emp_id, result in all_results.items():
+            employee = employees.get(emp_id)
+            employee_display_name = employee.name if employee else emp_id
+            append(f"--- Результаты для сотрудника: {employee_display_name} (ID: {emp_id}) ---\n")
+            append(result.get_summary() + "\n\n")
+        self.payroll_summary_text.setPlainText("\n".join(parts))
+
+        show_success(self, "Расчет завершен", "Расчет заработной платы для всех сотрудников завершен.")
+        self._update_overall_statistics()
+
+    def _export_payroll_results_csv(self):
+        if self._results_cache is not None and not self._results_cache:
+            QMessageBox.warning(self, "Предупреждение", "Нет данных для экспорта.")
+            return
+
+        file_path = self._prompt_csv_path("Экспорт в CSV", "Введите имя файла (например, payroll_results.csv):")
+        if file_path is None:
+            return
+        self._start_background_task(self._write_payroll_results_csv, self._on_payroll_results_exported,
+                                    "Ошибка экспорта", "Произошла ошибка при экспорте",
+                                    file_path, self._results_cache, dict(self.payroll_system.employees))
+
+    def _write_payroll_results_csv(self, file_path, cached_results, employees):
+        all_results = self._results_or_compute(cached_results)
+        if not all_results:
+            return all_results, None, None
+
+        rows = [PAYROLL_CSV_HEADER]
+        for emp_id, result in all_results.items():
+            employee = employees.get(emp_id)
+            rows.append((
+                emp_id,
+                employee.name if employee else "N/A",
+                f"{result.gross_pay:.2f}",
+                f"{result.net_pay:.2f}",
+                f"{result.taxes_breakdown.get('Подоходный налог', 0):.2f}",
+                f"{result.taxes_breakdown.get('Социальное страхование (сотрудник)', 0):.2f}",
+                f"{result.total_deductions:.2f}",
+                f"{result.employer_contributions_breakdown.get('Социальное страхование (работодатель)', 0):.2f}",
+            ))
+
+        try:
+            with open(file_path, 'w', encoding='utf-8', newline='', buffering=CSV_WRITE_BUFFER) as f:
+                csv.writer(f, lineterminator='\n').writerows(rows)
+        except Exception as e:
+            self.payroll_system.logger.log_activity(f"Ошибка экспорта результатов расчета в CSV: {e}")
+            raise
+        return all_results, None, file_path
+
+    def _on_payroll_results_exported(self, all_results, file_path):
+        if file_path is None:
+            QMessageBox.warning(self, "Предупреждение", "Нет данных для экспорта.")
+            return
+        show_success(self, "Экспорт завершен", f"Результаты успешно экспортированы в '{file_path}'.")
+        self.payroll_system.logger.log_activity(f"Результаты расчета экспортированы в CSV: '{file_path}'.")
+
+    def _update_overall_statistics(self):
+        (total_employees, total_gross_pay, total_net_pay,
+         total_employee_taxes_and_deductions) = self.payroll_system.get_overall_statistics()
+
+        self.total_employees_label.setText(f"Всего сотрудников: {total_employees}")
+        self.total_gross_pay_label.setText(f"Общая валовая ЗП: {total_gross_pay:.2f}")
+        self.total_net_pay_label.setText(f"Общая чистая ЗП: {total_net_pay:.2f}")
+        self.total_tax_deductions_label.setText(
+            f"Общие вычеты (налоги и т.д.): {total_employee_taxes_and_deductions:.2f}")
+
+    def _clear_all_data_gui(self):
+        reply = QMessageBox.question(self, "Подтверждение очистки данных",
+                                     "Вы уверены, что хотите удалить ВСЕ данные сотрудников, конфигурацию и логи?\nЭто действие необратимо!",
+                                     QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                                     QMessageBox.StandardButton.No)
+
+        if reply == QMessageBox.StandardButton.Yes:
+            self.payroll_system.clear_all_data()
+            self._invalidate_results()
+            self._populate_employee_list()
+            self._clear_input_fields()
+            self._log_offset = 0
+            self._refresh_activity_log()
+            show_success(self, "Данные очищены", "Все данные успешно удалены.")
+
+
+def main():
+    app = QApplication(sys.argv)
+    splash_pixmap = QPixmap(480, 240)
+    splash_pixmap.fill(QColor("#2b2b2b"))
+    splash = QSplashScreen(splash_pixmap)
+    splash.showMessage("Загрузка данных...", Qt.AlignmentFlag.AlignCenter, QColor("#f0f0f0"))
+    splash.show()
+    app.processEvents()
+
+    payroll_app = PayrollApp()
+    payroll_app.ready.connect(payroll_app.show)
+    payroll_app.ready.connect(lambda: splash.finish(payroll_app))
+
+    def on_load_failed(message):
+        splash.close()
+        QMessageBox.critical(None, "Ошибка загрузки", f"Не удалось загрузить данные системы: {message}")
+        app.exit(1)
+
+    payroll_app.load_failed.connect(on_load_failed)
+    sys.exit(app.exec())
+
+
+if __name__ == "__main__":
+    main()